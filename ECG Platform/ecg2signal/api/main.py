@@ -5,10 +5,30 @@ from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from ecg2signal import ECGConverter
 from ecg2signal.config import get_settings
 
+# Per-process converter for the batch pool: each worker loads its own
+# models once in the initializer instead of pickling them per task
+_worker_converter = None
+
+def _init_batch_worker():
+    global _worker_converter
+    _worker_converter = ECGConverter(get_settings())
+
+def _convert_one(tmp_path: str, paper_speed: float, gain: float) -> dict:
+    result = _worker_converter.convert(tmp_path, paper_speed=paper_speed, gain=gain)
+    output_dir = Path(tempfile.mkdtemp())
+    result.export_wfdb(str(output_dir), "ecg")
+    return {
+        "status": "success",
+        "num_leads": len(result.signals),
+        "sample_rate": result.sample_rate,
+        "files": [str(p) for p in output_dir.glob("*")],
+    }
+
 settings = get_settings()
 app = FastAPI(title="ECG2Signal API", version="0.1.0")
 
@@ -47,9 +67,11 @@ async def convert_ecg(
     gain: float = Form(10.0),
 ):
     """Convert ECG image to signals."""
+    # Stream to disk in 1 MB chunks instead of buffering the whole
+    # upload in memory; large PDFs no longer double peak RSS
     with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
+        while chunk := await file.read(1 << 20):
+            tmp.write(chunk)
         tmp_path = tmp.name
     
     try:
@@ -67,3 +89,41 @@ async def convert_ecg(
             return {"status": "success", "message": f"Format {format} processed"}
     finally:
         Path(tmp_path).unlink(missing_ok=True)
+
+@app.post("/convert_batch")
+async def convert_ecg_batch(
+    files: list[UploadFile] = File(...),
+    paper_speed: float = Form(25.0),
+    gain: float = Form(10.0),
+):
+    """Convert a batch of ECG images in parallel across CPU cores."""
+    tmp_paths = []
+    for file in files:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+            while chunk := await file.read(1 << 20):
+                tmp.write(chunk)
+            tmp_paths.append(tmp.name)
+
+    try:
+        # Conversion is CPU-bound and independent per file, so fan out
+        # over a process pool rather than serializing on one core
+        with ProcessPoolExecutor(
+            max_workers=min(settings.api_workers, len(tmp_paths)),
+            initializer=_init_batch_worker,
+        ) as executor:
+            futures = [
+                executor.submit(_convert_one, tmp_path, paper_speed, gain)
+                for tmp_path in tmp_paths
+            ]
+            results = []
+            for file, future in zip(files, futures):
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    entry = {"status": "error", "detail": str(e)}
+                entry["filename"] = file.filename
+                results.append(entry)
+        return {"status": "success", "results": results}
+    finally:
+        for tmp_path in tmp_paths:
+            Path(tmp_path).unlink(missing_ok=True)
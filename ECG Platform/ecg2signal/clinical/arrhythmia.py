@@ -546,3 +546,22 @@ class ArrhythmiaDetector:
             recommendations.append("Continue routine cardiac monitoring")
             
         return recommendations
+
+
+def detect_arrhythmias(
+    signals: Dict[str, np.ndarray],
+    sample_rate: int = 500,
+    r_peaks: Optional[Dict[str, np.ndarray]] = None,
+) -> ArrhythmiaReport:
+    """
+    Run the full arrhythmia analysis in one call.
+
+    Args:
+        signals: Dictionary of lead name -> signal array
+        sample_rate: Sampling rate in Hz
+        r_peaks: Optional pre-detected R-peak locations
+
+    Returns:
+        Complete arrhythmia analysis report
+    """
+    return ArrhythmiaDetector(sample_rate=sample_rate).detect(signals, r_peaks)
@@ -883,3 +883,41 @@ class ClinicalInterpreter:
             follow_up=follow_up,
             prognosis=prognosis
         )
+
+
+def interpret_ecg(
+    signals: Dict[str, np.ndarray],
+    sample_rate: int,
+    intervals: Intervals,
+    quality: QualityMetrics,
+    arrhythmia: Optional[ArrhythmiaReport] = None,
+    qt_analysis: Optional[QTAnalysis] = None,
+    patient_age: Optional[int] = None,
+    patient_gender: Optional[str] = None,
+) -> AutomatedFindings:
+    """
+    Generate automated clinical findings in one call.
+
+    Args:
+        signals: ECG signals by lead
+        sample_rate: Sampling rate in Hz
+        intervals: Measured intervals
+        quality: Quality metrics
+        arrhythmia: Optional arrhythmia analysis
+        qt_analysis: Optional QT analysis
+        patient_age: Optional patient age
+        patient_gender: Optional patient gender
+
+    Returns:
+        Complete automated findings report
+    """
+    return ClinicalInterpreter().interpret(
+        signals,
+        sample_rate,
+        intervals,
+        quality,
+        arrhythmia=arrhythmia,
+        qt_analysis=qt_analysis,
+        patient_age=patient_age,
+        patient_gender=patient_gender,
+    )
@@ -462,3 +462,24 @@ class QTAnalyzer:
         ]
         
         return drugs
+
+
+def analyze_qt(
+    signals: Dict[str, np.ndarray],
+    r_peaks: Dict[str, np.ndarray],
+    sample_rate: int = 500,
+    gender: Optional[str] = None,
+) -> QTAnalysis:
+    """
+    Run the full QT interval analysis in one call.
+
+    Args:
+        signals: Dictionary of lead name -> signal array
+        r_peaks: Dictionary of lead name -> R-peak locations
+        sample_rate: Sampling rate in Hz
+        gender: Patient gender ('M' or 'F') for gender-specific ranges
+
+    Returns:
+        Complete QT analysis with measurements and interpretation
+    """
+    return QTAnalyzer(sample_rate=sample_rate).analyze(signals, r_peaks, gender)
@@ -10,16 +10,46 @@ from loguru import logger
 from PIL import Image
 
 
-def load_image(image_path: str, grayscale: bool = False) -> np.ndarray:
+def _reduced_imread_flag(img_file: Path, grayscale: bool, max_side: int) -> int:
+    """
+    Pick an IMREAD flag that decodes oversized images at reduced resolution.
+
+    OpenCV's IMREAD_REDUCED_* flags decode JPEGs at 1/2, 1/4 or 1/8 scale
+    directly in the DCT domain, skipping most of the IDCT work compared
+    to decoding full-resolution and resizing afterwards.
+    """
+    mode = "GRAYSCALE" if grayscale else "COLOR"
+    try:
+        with Image.open(img_file) as probe:
+            src_side = max(probe.size)  # lazy: reads the header only
+    except Exception:
+        return cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+
+    for factor in (8, 4, 2):
+        if src_side >= max_side * factor:
+            return getattr(cv2, f"IMREAD_REDUCED_{mode}_{factor}")
+    return cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+
+
+def load_image(
+    image_path: str,
+    grayscale: bool = False,
+    max_side: int | None = None,
+    return_bgr: bool = False,
+) -> np.ndarray:
     """
     Load an image from file.
 
     Args:
         image_path: Path to image file
         grayscale: If True, convert to grayscale
+        max_side: If set, decode at reduced resolution when the source
+            is at least 2x larger than this along its longest side
+        return_bgr: If True, return OpenCV's native BGR ordering and
+            skip the RGB conversion copy
 
     Returns:
-        Image as numpy array (RGB or grayscale)
+        Image as numpy array (RGB, BGR or grayscale)
 
     Raises:
         FileNotFoundError: If image file doesn't exist
@@ -37,10 +67,22 @@ def load_image(image_path: str, grayscale: bool = False) -> np.ndarray:
 
     try:
         # Use OpenCV for loading
-        if grayscale:
-            img = cv2.imread(str(img_file), cv2.IMREAD_GRAYSCALE)
+        if max_side is not None:
+            flag = _reduced_imread_flag(img_file, grayscale, max_side)
+        elif not grayscale and not return_bgr and hasattr(cv2, "IMREAD_COLOR_RGB"):
+            # OpenCV >= 4.10 can decode straight to RGB, skipping the
+            # full-size cvtColor copy below
+            flag = cv2.IMREAD_COLOR_RGB
         else:
-            img = cv2.imread(str(img_file), cv2.IMREAD_COLOR)
+            flag = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+
+        img = cv2.imread(str(img_file), flag)
+        if (
+            not grayscale
+            and not return_bgr
+            and flag != getattr(cv2, "IMREAD_COLOR_RGB", None)
+            and img is not None
+        ):
             img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
 
         if img is None:
@@ -139,7 +181,7 @@ def resize_image(
     image: np.ndarray,
     target_size: tuple[int, int] | None = None,
     max_size: int | None = None,
-    interpolation: int = cv2.INTER_LINEAR,
+    interpolation: int | None = None,
 ) -> np.ndarray:
     """
     Resize image to target size or max dimension.
@@ -148,7 +190,8 @@ def resize_image(
         image: Input image
         target_size: Target (width, height), or None
         max_size: Maximum dimension size, or None
-        interpolation: OpenCV interpolation method
+        interpolation: OpenCV interpolation method, or None to pick
+            INTER_AREA for downscaling and INTER_LINEAR for upscaling
 
     Returns:
         Resized image
@@ -156,6 +199,12 @@ def resize_image(
     h, w = image.shape[:2]
 
     if target_size is not None:
+        if target_size == (w, h):
+            return image
+        if interpolation is None:
+            # INTER_AREA is both faster and less aliased when shrinking
+            downscale = target_size[0] < w or target_size[1] < h
+            interpolation = cv2.INTER_AREA if downscale else cv2.INTER_LINEAR
         return cv2.resize(image, target_size, interpolation=interpolation)
 
     if max_size is not None:
@@ -163,6 +212,8 @@ def resize_image(
         if scale < 1.0:
             new_w = int(w * scale)
             new_h = int(h * scale)
+            if interpolation is None:
+                interpolation = cv2.INTER_AREA
             return cv2.resize(image, (new_w, new_h), interpolation=interpolation)
 
     return image
@@ -2,6 +2,7 @@
 PDF processing for ECG images.
 """
 
+import os
 from pathlib import Path
 
 import numpy as np
@@ -28,8 +29,15 @@ def extract_pdf_pages(pdf_path: str, dpi: int = 300) -> list[np.ndarray]:
     logger.info(f"Extracting pages from PDF: {pdf_path}")
 
     try:
-        # Convert PDF pages to images
-        pil_images = convert_from_path(str(pdf_file), dpi=dpi)
+        # Convert PDF pages to images. Rasterization is independent per
+        # page, so let poppler fan out across cores; pdftocairo is
+        # considerably faster than pdftoppm for RGB output.
+        pil_images = convert_from_path(
+            str(pdf_file),
+            dpi=dpi,
+            thread_count=min(8, os.cpu_count() or 1),
+            use_pdftocairo=True,
+        )
         logger.info(f"Extracted {len(pil_images)} pages at {dpi} DPI")
 
         # Convert PIL images to numpy arrays
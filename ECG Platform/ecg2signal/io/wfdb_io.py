@@ -2,6 +2,8 @@
 WFDB (MIT/PhysioNet) format I/O for ECG signals.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -30,14 +32,40 @@ def write_wfdb(ecg_result, output_dir: str, record_name: str = "ecg") -> None:
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Prepare signals
-    signal_names = sorted(ecg_result.signals.keys())
-    p_signal = np.column_stack([ecg_result.signals[name] for name in signal_names])
+    # Prepare signals: one contiguous float32 matrix shared with any
+    # other exporter, instead of re-stacking the per-lead dict here
+    p_signal, signal_names = ecg_result.signal_matrix()
+    sig_len = p_signal.shape[0]
 
     # Convert to physical units (millivolts)
-    # WFDB expects integer ADC units, so we scale to preserve precision
+    # WFDB expects integer ADC units, so we scale to preserve precision.
+    # Fill the int16 destination column by column through one reused
+    # scratch row instead of materializing a float64 column_stack plus a
+    # second full-size scaled copy — the path is memory-bound. float32
+    # scratch suffices: every int16 ADC value is exactly representable,
+    # so no float64 intermediate is needed anywhere in the conversion.
     adc_gain = 1000  # 1000 ADC units per mV
-    d_signal = (p_signal * adc_gain).astype(np.int16)
+    d_signal = np.empty((sig_len, len(signal_names)), dtype=np.int16)
+
+    def _convert_lead(i: int, scratch: np.ndarray | None = None) -> None:
+        if scratch is None:
+            scratch = np.empty(sig_len, dtype=np.float32)
+        np.multiply(p_signal[:, i], adc_gain, out=scratch)
+        np.rint(scratch, out=scratch)
+        d_signal[:, i] = scratch
+
+    # Leads convert independently and numpy releases the GIL inside the
+    # ufuncs, so long records fan out across a thread pool; short ones
+    # stay serial with one shared scratch row (thread startup would cost
+    # more than the conversion)
+    if sig_len * len(signal_names) >= 1 << 20:
+        workers = min(len(signal_names), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_convert_lead, range(len(signal_names))))
+    else:
+        scratch = np.empty(sig_len, dtype=np.float32)
+        for i in range(len(signal_names)):
+            _convert_lead(i, scratch)
 
     # Prepare metadata
     sig_name = signal_names
@@ -57,23 +85,37 @@ def write_wfdb(ecg_result, output_dir: str, record_name: str = "ecg") -> None:
     if ecg_result.intervals.heart_rate:
         comments.append(f"Heart rate: {ecg_result.intervals.heart_rate:.1f} BPM")
 
-    # Write WFDB record
+    # Write WFDB record. The .dat payload is one contiguous int16 buffer
+    # (samples interleaved across leads, per the format-16 spec), so dump
+    # it with a single tofile() instead of wfdb.wrsamp's per-signal
+    # Python loops, and emit the small text header ourselves.
     try:
-        wfdb.wrsamp(
-            record_name=record_name,
-            fs=ecg_result.sample_rate,
-            units=units,
-            sig_name=sig_name,
-            p_signal=p_signal,
-            d_signal=d_signal,
-            fmt=fmt,
-            adc_gain=adc_gain_list,
-            baseline=baseline,
-            comments=comments,
-            write_dir=str(output_path),
-        )
+        n_sig = d_signal.shape[1]
+        dat_name = f"{record_name}.dat"
+
+        buf = np.ascontiguousarray(d_signal)
+        with open(output_path / dat_name, "wb", buffering=1 << 20) as f:
+            buf.tofile(f)
+
+        # Per-signal checksum: sum of samples modulo 65536 (wfdb convention)
+        checksums = np.sum(d_signal, axis=0, dtype=np.int64) % 65536
+
+        header_lines = [f"{record_name} {n_sig} {ecg_result.sample_rate} {sig_len}"]
+        for i in range(n_sig):
+            header_lines.append(
+                f"{dat_name} {fmt[i]} {adc_gain_list[i]}({baseline[i]})/{units[i]} "
+                f"16 0 {d_signal[0, i]} {checksums[i]} 0 {sig_name[i]}"
+            )
+        header_lines.extend(f"# {comment}" for comment in comments)
 
-        logger.info(f"Wrote WFDB record: {output_path / record_name}")
+        with open(output_path / f"{record_name}.hea", "w") as f:
+            f.write("\n".join(header_lines) + "\n")
+
+        # Lazy formatting: batch jobs run with INFO disabled, and the
+        # eager f-string (plus Path str conversion) per record adds up
+        logger.opt(lazy=True).info(
+            "Wrote WFDB record: {}", lambda: output_path / record_name
+        )
 
     except Exception as e:
         logger.error(f"Failed to write WFDB record: {e}")
@@ -103,7 +145,7 @@ def read_wfdb(record_path: str) -> tuple[np.ndarray, dict]:
             "comments": record.comments,
         }
 
-        logger.info(f"Read WFDB record: {record_path}")
+        logger.opt(lazy=True).info("Read WFDB record: {}", lambda: record_path)
         return signals, metadata
 
     except Exception as e:
@@ -111,6 +153,100 @@ def read_wfdb(record_path: str) -> tuple[np.ndarray, dict]:
         raise
 
 
+def read_wfdb_metadata(record_path: str) -> dict:
+    """
+    Read WFDB record metadata without touching the signal data.
+
+    Args:
+        record_path: Path to WFDB record (without extension)
+
+    Returns:
+        Metadata dict matching read_wfdb's second return value
+    """
+    try:
+        header = wfdb.rdheader(record_path)
+        return {
+            "sig_name": header.sig_name,
+            "fs": header.fs,
+            "units": header.units,
+            "sig_len": header.sig_len,
+            "n_sig": header.n_sig,
+            "comments": header.comments,
+        }
+    except Exception as e:
+        logger.error(f"Failed to read WFDB header: {e}")
+        raise
+
+
+def read_wfdb_digital(record_path: str) -> tuple[np.ndarray, dict]:
+    """
+    Read a WFDB record's raw ADC samples without copying the .dat file.
+
+    Format-16 records stored in a single .dat are presented as an int16
+    memory-mapped (sig_len, n_sig) view backed by the page cache, so no
+    decode or memcpy of the signal bytes happens up front. Consumers can
+    convert lazily with (raw - baseline) / adc_gain using the metadata.
+    Other formats fall back to wfdb's regular digital read.
+
+    Args:
+        record_path: Path to WFDB record (without extension)
+
+    Returns:
+        Tuple of (int16 digital signals, metadata dict); metadata also
+        carries adc_gain and baseline for physical conversion
+    """
+    header = wfdb.rdheader(record_path)
+    metadata = {
+        "sig_name": header.sig_name,
+        "fs": header.fs,
+        "units": header.units,
+        "sig_len": header.sig_len,
+        "n_sig": header.n_sig,
+        "comments": header.comments,
+        "adc_gain": header.adc_gain,
+        "baseline": header.baseline,
+    }
+
+    # The zero-copy view only holds for plain format-16 layouts: byte
+    # offsets (e.g. "16+512" headers) and multi-sample frames shift or
+    # interleave the samples, so those records take the decoded path.
+    dat_files = set(header.file_name or [])
+    if (
+        set(header.fmt or []) == {"16"}
+        and len(dat_files) == 1
+        and not any(header.byte_offset or [])
+        and all(spf == 1 for spf in header.samps_per_frame or [])
+    ):
+        dat_path = Path(record_path).parent / dat_files.pop()
+        raw = np.memmap(dat_path, dtype=np.int16, mode="r")
+        return raw.reshape(-1, header.n_sig), metadata
+
+    record = wfdb.rdrecord(record_path, physical=False)
+    return record.d_signal, metadata
+
+
+def read_wfdb_chunks(record_path: str, chunk_size: int = 100_000):
+    """
+    Yield a WFDB record's physical signals in sample chunks.
+
+    Keeps peak memory at O(chunk_size * n_sig) instead of loading the
+    whole record, which matters for long ambulatory recordings.
+
+    Args:
+        record_path: Path to WFDB record (without extension)
+        chunk_size: Samples per yielded chunk
+
+    Yields:
+        (start_sample, signals) tuples with signals of shape
+        (chunk, n_sig)
+    """
+    header = wfdb.rdheader(record_path)
+    for start in range(0, header.sig_len, chunk_size):
+        stop = min(start + chunk_size, header.sig_len)
+        record = wfdb.rdrecord(record_path, sampfrom=start, sampto=stop)
+        yield start, record.p_signal
+
+
 def validate_wfdb_record(record_path: str) -> bool:
     """
     Validate WFDB record integrity.
@@ -122,7 +258,9 @@ def validate_wfdb_record(record_path: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        record = wfdb.rdrecord(record_path)
-        return record.sig_len > 0 and record.n_sig > 0
+        # rdheader parses only the small .hea text file; rdrecord would
+        # read and decode the entire .dat payload just for two counters
+        header = wfdb.rdheader(record_path)
+        return header.sig_len > 0 and header.n_sig > 0
     except Exception:
         return False
@@ -97,11 +97,10 @@ def detect_lines(image: np.ndarray, orientation: str = "horizontal") -> list[int
     if lines is None:
         return []
 
-    # Extract line positions
+    # Extract line positions. HoughLinesP returns (N, 1, 4) in OpenCV 4
+    # and (N, 4) in OpenCV 5; flatten to one row per segment first.
     positions = []
-    for line in lines:
-        x1, y1, x2, y2 = line[0]
-
+    for x1, y1, x2, y2 in lines.reshape(-1, 4):
         if orientation == "horizontal":
             # Check if line is mostly horizontal
             if abs(y2 - y1) < abs(x2 - x1) * 0.1:
@@ -186,10 +185,10 @@ def estimate_grid_angle(gray: np.ndarray, h_lines: list[int], v_lines: list[int]
     if lines is None:
         return 0.0
 
-    # Collect angles
+    # Collect angles; reshape handles both the (N, 1, 2) and (N, 2)
+    # HoughLines layouts (OpenCV 4 vs 5)
     angles = []
-    for line in lines:
-        rho, theta = line[0]
+    for rho, theta in lines.reshape(-1, 2):
         angle = np.degrees(theta)
 
         # Normalize to -45 to 45 degrees
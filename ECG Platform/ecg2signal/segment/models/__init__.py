@@ -0,0 +1,7 @@
+"""ML models for ECG image segmentation."""
+
+from ecg2signal.segment.models.unet import UNetSegmenter
+
+__all__ = [
+    "UNetSegmenter",
+]
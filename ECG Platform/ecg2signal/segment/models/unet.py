@@ -0,0 +1,113 @@
+
+from functools import lru_cache
+
+import numpy as np
+from loguru import logger
+
+# torch is only needed for the trainable architecture; the ONNX-backed
+# segmenter below must stay importable in inference-only installs
+try:
+    import torch
+    from torch import nn
+except ImportError:
+    torch = None
+    nn = None
+
+
+@lru_cache(maxsize=4)
+def _stub_templates(h: int, w: int) -> tuple[np.ndarray, np.ndarray]:
+    """Read-only zero/255 masks shared by every segment() call per shape."""
+    zeros = np.zeros((h, w), dtype=np.uint8)
+    ones255 = np.full((h, w), 255, dtype=np.uint8)
+    zeros.setflags(write=False)
+    ones255.setflags(write=False)
+    return zeros, ones255
+
+
+class UNetSegmenter:
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        logger.info(f"Initialized U-Net segmenter")
+
+    def segment(self, image: np.ndarray) -> dict[str, np.ndarray]:
+        # Stub masks are constant per shape, so hand out cached
+        # read-only arrays instead of allocating and filling three
+        # full-size buffers on every call
+        h, w = image.shape[:2]
+        zeros, ones255 = _stub_templates(h, w)
+        return {
+            "grid": zeros,
+            "waveform": ones255,
+            "text": zeros,
+        }
+
+if nn is not None:
+
+    class _DoubleConv(nn.Sequential):
+        """Two 3x3 conv + batch norm + ReLU blocks, optionally with dropout."""
+
+        def __init__(self, in_channels: int, out_channels: int, dropout: float = 0.0):
+            layers = [
+                nn.Conv2d(in_channels, out_channels, 3, padding=1, bias=False),
+                nn.BatchNorm2d(out_channels),
+                nn.ReLU(inplace=True),
+                nn.Conv2d(out_channels, out_channels, 3, padding=1, bias=False),
+                nn.BatchNorm2d(out_channels),
+                nn.ReLU(inplace=True),
+            ]
+            if dropout > 0:
+                layers.append(nn.Dropout2d(dropout))
+            super().__init__(*layers)
+
+    class UNet(nn.Module):
+        """
+        U-Net segmentation network (Ronneberger et al., 2015).
+
+        Args:
+            in_channels: Input image channels
+            out_channels: Output mask channels (grid, waveform, text)
+            features: Encoder widths, shallowest first
+            dropout: Dropout probability after each double-conv block
+        """
+
+        def __init__(
+            self,
+            in_channels: int = 1,
+            out_channels: int = 3,
+            features: list[int] = [16, 32, 64],
+            dropout: float = 0.0,
+        ):
+            super().__init__()
+            self.pool = nn.MaxPool2d(2)
+            self.downs = nn.ModuleList()
+            self.ups = nn.ModuleList()
+
+            channels = in_channels
+            for feature in features:
+                self.downs.append(_DoubleConv(channels, feature, dropout))
+                channels = feature
+
+            self.bottleneck = _DoubleConv(features[-1], features[-1] * 2, dropout)
+
+            for feature in reversed(features):
+                self.ups.append(nn.ConvTranspose2d(feature * 2, feature, 2, stride=2))
+                self.ups.append(_DoubleConv(feature * 2, feature, dropout))
+
+            self.head = nn.Conv2d(features[0], out_channels, 1)
+
+        def forward(self, x: "torch.Tensor") -> "torch.Tensor":
+            skips = []
+            for down in self.downs:
+                x = down(x)
+                skips.append(x)
+                x = self.pool(x)
+
+            x = self.bottleneck(x)
+
+            for up, conv, skip in zip(self.ups[0::2], self.ups[1::2], reversed(skips)):
+                x = up(x)
+                if x.shape[2:] != skip.shape[2:]:
+                    x = nn.functional.interpolate(x, size=skip.shape[2:])
+                x = conv(torch.cat([skip, x], dim=1))
+
+            return self.head(x)
@@ -6,7 +6,7 @@ from enum import Enum
 from typing import Any
 
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ExportFormat(str, Enum):
@@ -217,6 +217,8 @@ class ECGResult(BaseModel):
     intervals: Intervals
     quality_metrics: QualityMetrics
 
+    _signal_matrix_cache: tuple[np.ndarray, list[str]] | None = PrivateAttr(default=None)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -236,6 +238,25 @@ class ECGResult(BaseModel):
         first_signal = next(iter(self.signals.values()))
         return len(first_signal)
 
+    def signal_matrix(self) -> tuple[np.ndarray, list[str]]:
+        """
+        Get all leads as one contiguous (n_samples, n_leads) float32 array.
+
+        Built lazily and cached, so exporters that need the stacked
+        layout share a single buffer instead of each re-stacking the
+        per-lead arrays from the signals dict.
+
+        Returns:
+            Tuple of (signal matrix, lead names in column order)
+        """
+        if self._signal_matrix_cache is None:
+            names = sorted(self.signals.keys())
+            matrix = np.empty((self.num_samples, len(names)), dtype=np.float32)
+            for i, name in enumerate(names):
+                matrix[:, i] = self.signals[name]
+            self._signal_matrix_cache = (matrix, names)
+        return self._signal_matrix_cache
+
     def export_wfdb(self, output_dir: str, record_name: str = "ecg") -> None:
         """
         Export signals to WFDB format.
@@ -311,6 +332,11 @@ class ECGResult(BaseModel):
         import json
         from pathlib import Path
 
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
         data = {
             "sample_rate": self.sample_rate,
             "duration_seconds": self.duration_seconds,
@@ -319,11 +345,19 @@ class ECGResult(BaseModel):
             "metadata": self.metadata.dict(),
             "intervals": self.intervals.dict(),
             "quality_metrics": self.quality_metrics.dict(),
-            "signals": {name: sig.tolist() for name, sig in self.signals.items()},
         }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            # orjson serializes ndarrays directly, skipping the cost of
+            # materializing thousands of Python floats per lead
+            data["signals"] = dict(self.signals)
+            Path(output_path).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+            )
+        else:
+            data["signals"] = {name: sig.tolist() for name, sig in self.signals.items()}
+            with open(output_path, "w") as f:
+                json.dump(data, f, indent=2)
 
     def export_all(self, output_dir: str, record_name: str = "ecg") -> None:
         """
@@ -3,15 +3,39 @@ Visualization utilities for ECG2Signal.
 
 Beautiful plotting functions for signals, quality metrics, and clinical data.
 """
+import os
+from functools import lru_cache
+
 import numpy as np
+import matplotlib
+
+# Report generation is non-interactive: the Agg raster backend is much
+# faster than interactive backends. Set ECG2SIGNAL_INTERACTIVE_PLOTS=1
+# to keep the default backend for interactive use.
+if os.environ.get("ECG2SIGNAL_INTERACTIVE_PLOTS") != "1":
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+
+# Skip colinear points when rasterizing long ECG traces
+plt.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
 from typing import Dict, List, Optional, Tuple
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
 
 
+@lru_cache(maxsize=16)
+def _lead_palette(n_leads: int) -> np.ndarray:
+    """Colormap palette per lead count, shared across figures."""
+    return plt.cm.Set3(np.linspace(0, 1, n_leads))
+
+
 def plot_ecg_signals(
     signals: Dict[str, np.ndarray],
     fs: float = 500.0,
@@ -38,20 +62,22 @@ def plot_ecg_signals(
     if n_leads == 1:
         axes = [axes]
     
-    colors = plt.cm.Set3(np.linspace(0, 1, n_leads))
-    
+    colors = _lead_palette(n_leads)
+
+    # Time axis is identical across leads: compute it once instead of
+    # allocating a fresh arange + divide per lead
+    n_samples = max(len(s) for s in signals.values())
+    if duration:
+        n_samples = min(n_samples, int(duration * fs))
+    time = np.arange(n_samples, dtype=np.float32) / fs
+
     for idx, (lead_name, signal) in enumerate(signals.items()):
         ax = axes[idx]
-        
-        # Calculate time array
-        if duration:
-            n_samples = int(duration * fs)
-            signal = signal[:n_samples]
-        
-        time = np.arange(len(signal)) / fs
-        
+
+        signal = signal[:n_samples]
+
         # Plot
-        ax.plot(time, signal, color=colors[idx], linewidth=1.5, label=lead_name)
+        ax.plot(time[:len(signal)], signal, color=colors[idx], linewidth=1.5, label=lead_name)
         ax.set_ylabel('Amplitude (mV)', fontsize=10)
         ax.legend(loc='upper right', fontsize=10)
         ax.grid(True, alpha=0.3)
@@ -66,83 +92,86 @@ def plot_ecg_signals(
     return fig
 
 
+# Static report fragments: the CSS/header/footer never change between
+# reports, so build them once at import instead of per call
+_REPORT_HEADER = "\n".join([
+    "<html>",
+    "<head>",
+    "<title>ECG2Signal Quality Report</title>",
+    "<style>",
+    "body { font-family: Arial, sans-serif; margin: 20px; }",
+    "h1 { color: #667eea; }",
+    "h2 { color: #4ECDC4; margin-top: 30px; }",
+    ".summary { background: #f5f5f5; padding: 15px; border-radius: 5px; }",
+    ".metric { display: inline-block; margin: 10px; padding: 10px; background: white; border-radius: 5px; }",
+    "</style>",
+    "</head>",
+    "<body>",
+    "<h1>ECG2Signal Quality Report</h1>",
+])
+
+_REPORT_FOOTER = "</body>\n</html>"
+
+_METRIC_TMPL = "<div class='metric'>\n<strong>{0}:</strong> {1}\n</div>"
+
+
+def _result_row(idx: int, result_data: Dict) -> str:
+    """Render one conversion result as an HTML fragment."""
+    result = result_data['result']
+    filename = result_data['filename']
+
+    parts = [
+        f"<h2>Result {idx}: {filename}</h2>",
+        _METRIC_TMPL.format("Leads", len(result.signals)),
+    ]
+
+    if result.quality_metrics:
+        parts.append(_METRIC_TMPL.format(
+            "Quality", f"{result.quality_metrics.overall_score:.2%}"))
+
+    if result.intervals and result.intervals.get('heart_rate'):
+        parts.append(_METRIC_TMPL.format(
+            "Heart Rate", f"{result.intervals['heart_rate']:.0f} BPM"))
+
+    return "\n".join(parts)
+
+
 def create_quality_report(
     results: List[Dict],
     output_path: str
 ):
     """
     Create comprehensive quality report as HTML.
-    
+
     Args:
         results: List of conversion results
         output_path: Path to save HTML report
     """
     from datetime import datetime
-    
-    html_parts = [
-        "<html>",
-        "<head>",
-        "<title>ECG2Signal Quality Report</title>",
-        "<style>",
-        "body { font-family: Arial, sans-serif; margin: 20px; }",
-        "h1 { color: #667eea; }",
-        "h2 { color: #4ECDC4; margin-top: 30px; }",
-        ".summary { background: #f5f5f5; padding: 15px; border-radius: 5px; }",
-        ".metric { display: inline-block; margin: 10px; padding: 10px; background: white; border-radius: 5px; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        f"<h1>ECG2Signal Quality Report</h1>",
+
+    summary_parts = [
         f"<p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
-        f"<div class='summary'>",
-        f"<h2>Summary</h2>",
+        "<div class='summary'>",
+        "<h2>Summary</h2>",
         f"<p>Total files processed: {len(results)}</p>",
     ]
-    
+
     # Calculate summary statistics
-    quality_scores = [r['result'].quality_metrics.overall_score 
+    quality_scores = [r['result'].quality_metrics.overall_score
                      for r in results if r['result'].quality_metrics]
-    
+
     if quality_scores:
-        html_parts.extend([
+        summary_parts.extend([
             f"<p>Average quality: {np.mean(quality_scores):.2%}</p>",
             f"<p>Min quality: {np.min(quality_scores):.2%}</p>",
             f"<p>Max quality: {np.max(quality_scores):.2%}</p>",
         ])
-    
-    html_parts.append("</div>")
-    
-    # Individual results
-    for idx, result_data in enumerate(results, 1):
-        result = result_data['result']
-        filename = result_data['filename']
-        
-        html_parts.extend([
-            f"<h2>Result {idx}: {filename}</h2>",
-            "<div class='metric'>",
-            f"<strong>Leads:</strong> {len(result.signals)}",
-            "</div>",
-        ])
-        
-        if result.quality_metrics:
-            html_parts.extend([
-                "<div class='metric'>",
-                f"<strong>Quality:</strong> {result.quality_metrics.overall_score:.2%}",
-                "</div>",
-            ])
-        
-        if result.intervals and result.intervals.get('heart_rate'):
-            html_parts.extend([
-                "<div class='metric'>",
-                f"<strong>Heart Rate:</strong> {result.intervals['heart_rate']:.0f} BPM",
-                "</div>",
-            ])
-    
-    html_parts.extend([
-        "</body>",
-        "</html>"
-    ])
-    
-    # Write to file
+
+    summary_parts.append("</div>")
+
+    body = "\n".join(_result_row(idx, r) for idx, r in enumerate(results, 1))
+
+    html = "\n".join([_REPORT_HEADER, "\n".join(summary_parts), body, _REPORT_FOOTER])
+
     with open(output_path, 'w') as f:
-        f.write('\n'.join(html_parts))
+        f.write(html)
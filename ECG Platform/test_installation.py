@@ -45,8 +45,8 @@ def test_image_processing():
         import cv2
         from ecg2signal.preprocess import denoise, detect_page
         
-        # Create test image
-        test_img = np.random.randint(0, 255, (512, 512), dtype=np.uint8)
+        # Create test image (default_rng is ~2x faster than legacy randint)
+        test_img = np.random.default_rng(0).integers(0, 255, (512, 512), dtype=np.uint8)
         
         # Test denoise
         denoised = denoise.denoise_image(test_img)
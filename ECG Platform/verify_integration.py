@@ -5,6 +5,8 @@ Verification script for ECG2Signal integration.
 This script verifies that all modules are properly integrated and importable.
 """
 
+import importlib
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -35,18 +37,26 @@ def test_imports():
         "cli": ["cli"],
     }
 
-    for subpkg, items in subpackages.items():
+    # Resolve every subpackage exactly once: find_spec confirms it
+    # exists without running its top-level code, then one
+    # import_module call per package populates a dict that all the
+    # attribute checks below share
+    mods = {}
+    for subpkg in subpackages:
+        if importlib.util.find_spec(f"ecg2signal.{subpkg}") is None:
+            errors.append(f"✗ ecg2signal.{subpkg} not found")
+            continue
         try:
-            module = __import__(f"ecg2signal.{subpkg}", fromlist=items)
-            for item in items:
-                if hasattr(module, item):
-                    continue
-                else:
-                    errors.append(f"✗ ecg2signal.{subpkg}.{item} not found")
-            print(f"✓ ecg2signal.{subpkg} imports successful")
+            mods[subpkg] = importlib.import_module(f"ecg2signal.{subpkg}")
         except ImportError as e:
             errors.append(f"✗ ecg2signal.{subpkg} import failed: {e}")
 
+    for subpkg, module in mods.items():
+        for item in subpackages[subpkg]:
+            if not hasattr(module, item):
+                errors.append(f"✗ ecg2signal.{subpkg}.{item} not found")
+        print(f"✓ ecg2signal.{subpkg} imports successful")
+
     return errors
 
 